@@ -1,5 +1,6 @@
 from typing import Type, TypeVar, overload
 from sqlalchemy import ScalarResult, Select
+from sqlalchemy.exc import UnboundExecutionError
 from sqlalchemy.orm import Query
 from sqlalchemy.ext.asyncio import (
     AsyncSession as SqlAlchemyAsyncSession,
@@ -9,6 +10,7 @@ from sqlalchemy.ext.asyncio import (
 from fastapi import Depends, HTTPException
 
 from ..utils.misc import log
+from ..utils.db import native_upsert
 from ..db.database import Base, select
 from ..exc import DbException
 
@@ -89,18 +91,26 @@ class AsyncSession(SqlAlchemyAsyncSession):
     async def find_or_create(
         self, model: Type[Base], find_by=None, flush=True, **kwargs
     ):
-        q = select(model)
         filters = kwargs
+        by_pk = False
         if find_by:
             filters = {k: v for k, v in kwargs.items() if k in find_by}
         else:
             pks = list(map(lambda x: x.name, model.__mapper__.primary_key))
             if all(k in kwargs for k in pks):
                 filters = {k: v for k, v in kwargs.items() if k in pks}
+                by_pk = True
 
-        q = q.filter_by(**filters)
-
-        ret = (await self.exec(q)).one_or_none()
+        if by_pk:
+            # served from the identity map when already loaded, no round trip
+            ret = await self.get(model, filters)
+            if ret is not None and ret in self.deleted:
+                # get doesn't autoflush: flush the pending delete as a query would
+                await self.flush()
+                ret = None
+        else:
+            q = select(model).filter_by(**filters)
+            ret = (await self.exec(q)).one_or_none()
         if not ret:
             ret = model(**kwargs)
             self.add(ret)
@@ -113,6 +123,19 @@ class AsyncSession(SqlAlchemyAsyncSession):
             pks = list(map(lambda x: x.name, model.__mapper__.primary_key))
             if not all(k in kwargs for k in pks):
                 raise DbException("find_by or primary key must be provided")
+        if flush:
+            try:
+                dialect = self.get_bind(model).dialect
+            except UnboundExecutionError:
+                dialect = None
+            stmt = native_upsert(model, dialect, find_by, kwargs)
+            if stmt is not None:
+                await self.flush()
+                return (
+                    await self.scalars(
+                        stmt, execution_options={"populate_existing": True}
+                    )
+                ).one()
         e = await self.find_or_create(model, find_by=find_by, flush=False, **kwargs)
         for k, v in kwargs.items():
             setattr(e, k, v)
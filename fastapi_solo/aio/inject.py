@@ -1,9 +1,8 @@
-from typing import Annotated, Any, Optional, get_args, get_origin
+from typing import Any, Optional
 from types import AsyncGeneratorType, GeneratorType
-from inspect import signature, iscoroutinefunction, isasyncgenfunction
+from inspect import iscoroutinefunction, isasyncgenfunction
 from fastapi import BackgroundTasks, Request
-from fastapi.params import Depends
-from pydantic.fields import FieldInfo
+from fastapi_solo.utils.inject import _get_plan
 from fastapi_solo.utils.misc import InjectedBackgroundTasks
 
 
@@ -57,41 +56,27 @@ async def _aresolve_dep(dep, use_cache, cache, yields):
         return await _ainit_dep(dep, cache, yields)
 
 
-async def _aresolve_dependencies(sign, kwargs, cache, yields):
-    for key, p in sign.parameters.items():
+async def _aresolve_dependencies(plan, kwargs, cache, yields):
+    for kind, key, value, use_cache in plan:
         if key in kwargs:
             continue
-        if isinstance(p.default, Depends):
-            kwargs[key] = await _aresolve_dep(
-                p.default.dependency or p.annotation,
-                p.default.use_cache,
-                cache,
-                yields,
-            )
-        elif isinstance(p.default, FieldInfo):
-            kwargs[key] = p.default.default
-        elif p.annotation == Request:
+        if kind == "dep":
+            kwargs[key] = await _aresolve_dep(value, use_cache, cache, yields)
+        elif kind == "default":
+            kwargs[key] = value
+        elif kind == "request":
             kwargs[key] = cache.get(Request)
-        elif p.annotation == BackgroundTasks:
+        else:
             kwargs[key] = cache.get(BackgroundTasks) or InjectedBackgroundTasks()
-        elif get_origin(p.annotation) is Annotated:
-            d_type, meta_deps = get_args(p.annotation)
-            if meta_deps:
-                kwargs[key] = await _aresolve_dep(
-                    meta_deps.dependency or d_type,
-                    meta_deps.use_cache,
-                    cache,
-                    yields,
-                )
 
 
 def _injector_fn(fn, _cache, _yields):
-    sign = signature(fn)
+    plan = _get_plan(fn)
 
     async def wrapper(*args, **kwargs):
         cache = _cache if _cache is not None else {}
         yields = _yields if _yields is not None else []
-        await _aresolve_dependencies(sign, kwargs, cache, yields)
+        await _aresolve_dependencies(plan, kwargs, cache, yields)
         try:
             if isasyncgenfunction(fn):
                 gen = fn(*args, **kwargs)
@@ -1,4 +1,5 @@
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
+from sqlalchemy import insert
 from sqlalchemy.orm.relationships import RelationshipProperty
 from sqlalchemy.ext.asyncio import (
     AsyncSession as SqlAlchemyAsyncSession,
@@ -118,6 +119,19 @@ async def acreate(
     return model
 
 
+@classmethod
+async def abulk_create(cls, db: SqlAlchemyAsyncSession, rows: List[Dict[str, Any]]):
+    """Insert many rows from one INSERT ... RETURNING statement and return the created instances
+
+    the rows are batched only where the driver supports it, sqlite still runs one insert per row
+    """
+    if not rows:
+        return []
+    stmt = insert(cls).returning(cls, sort_by_parameter_order=True)
+    return (await db.scalars(stmt, rows)).all()
+
+
 Base.asave = asave
 Base.adelete = adelete
 Base.acreate = acreate
+Base.abulk_create = abulk_create
@@ -1,6 +1,6 @@
 from typing import Optional
 from inflection import camelize
-from ..utils.testing import match
+from ..utils.testing import match, _page_params
 from ..utils.config import FastapiSoloConfig
 
 
@@ -8,8 +8,8 @@ async def acheck_filters(
     client, path: str, filters: dict, expected_result=None, result_count: int = 1
 ):
     """Test a given index endpoint to check if filters are working correctly."""
-    query = "&".join([f"filter[{field}]={value}" for field, value in filters.items()])
-    response = await client.get(f"{path}?{query}")
+    params = {f"filter[{field}]": value for field, value in filters.items()}
+    response = await client.get(path, params=params)
     assert response.status_code == 200
     data = response.json().get("data")
     assert len(data) == result_count
@@ -21,13 +21,13 @@ async def acheck_filters(
 
 async def acheck_sort(client, path: str, field: str = "id"):
     """Test a given index endpoint to check if sorting is working correctly."""
-    response = await client.get(f"{path}?sort={field}")
+    response = await client.get(path, params={"sort": field})
     data = response.json().get("data")
     assert response.status_code == 200
     ids = [obj[camelize(field, False)] for obj in data]
     assert ids == sorted(ids)
 
-    response = await client.get(f"{path}?sort=-{field}")
+    response = await client.get(path, params={"sort": f"-{field}"})
     data = response.json().get("data")
     assert response.status_code == 200
     ids = [obj[camelize(field, False)] for obj in data]
@@ -40,7 +40,7 @@ async def acheck_pagination(client, path: str, total: int, page_size: int = 2):
     """Test a given index endpoint to check if pagination is working correctly."""
     assert total >= page_size * 2
 
-    response = await client.get(f"{path}?page[number]=1&page[size]={page_size}")
+    response = await client.get(path, params=_page_params(1, page_size))
     body = response.json()
     data = body.get("data")
     meta = body.get("meta")
@@ -55,9 +55,7 @@ async def acheck_pagination(client, path: str, total: int, page_size: int = 2):
     assert meta["nextPage"] == 2
     assert meta["previousPage"] is None
 
-    response = await client.get(
-        f"{path}?page[number]={total_pages}&page[size]={page_size}"
-    )
+    response = await client.get(path, params=_page_params(total_pages, page_size))
     body = response.json()
     data = body.get("data")
     meta = body.get("meta")
@@ -68,9 +66,7 @@ async def acheck_pagination(client, path: str, total: int, page_size: int = 2):
     assert meta["nextPage"] is None
     assert meta["previousPage"] == total_pages - 1
 
-    response = await client.get(
-        f"{path}?page[number]={total_pages+1}&page[size]={page_size}"
-    )
+    response = await client.get(path, params=_page_params(total_pages + 1, page_size))
     body = response.json()
     data = body.get("data")
     meta = body.get("meta")
@@ -1,5 +1,5 @@
 from typing import Callable, Optional, TypeVar, TYPE_CHECKING
-from fastapi_solo.utils.pagination import paginate_result
+from fastapi_solo.utils.pagination import count_from_page, paginate_result
 from fastapi_solo.utils.config import FastapiSoloConfig
 
 
@@ -34,8 +34,10 @@ async def apaginate_query(
             data = before_render(data)
         return {"data": data}
 
-    count: int = (await db.execute(query.count())).unique().scalar()  # type: ignore
     data = (await db.exec(query.paginate(page=page, size=size))).all()
+    count = count_from_page(data, page, size)  # type: ignore
+    if count is None:
+        count = (await db.execute(query.count())).unique().scalar()  # type: ignore
     if before_render:
         data = before_render(data)
     return paginate_result(data, count, page, size)
@@ -9,7 +9,8 @@ from typing import (
     TYPE_CHECKING,
 )
 from typing_extensions import deprecated
-from sqlalchemy import ScalarResult, func, Engine, Select
+from sqlalchemy import ScalarResult, func, insert, Engine, Select
+from sqlalchemy.exc import UnboundExecutionError
 from sqlalchemy.orm import (
     declarative_base,
     sessionmaker,
@@ -29,6 +30,7 @@ from .queryable import Queryable
 from ..utils.misc import log
 from ..utils.db import (
     get_single_pk,
+    native_upsert,
     CreatedAtColumn,
     UpdatedAtColumn,
 )
@@ -151,6 +153,24 @@ class Base(declarative_base()):
         model.save(db, flush=flush)
         return model
 
+    @classmethod
+    def bulk_create(cls, db: SqlAlchemySession, rows: List[Dict[str, Any]]):
+        """Insert many rows from one INSERT ... RETURNING statement and return the created instances
+
+        rows must contain plain column values, relationships are not decoded;
+        the rows are batched only where the driver supports it, sqlite still
+        runs one insert per row to return them in parameter order
+
+        **Example:**
+        ```
+        posts = Post.bulk_create(db, [{"title": "Hello"}, {"title": "World"}])
+        ```
+        """
+        if not rows:
+            return []
+        stmt = insert(cls).returning(cls, sort_by_parameter_order=True)
+        return db.scalars(stmt, rows).all()
+
     @classmethod
     def get_model(cls, model: str):
         models = cls.registry._class_registry.values()
@@ -240,18 +260,26 @@ class Session(SqlAlchemySession):
         user = User.find_or_create(find_by=["name"], name="Albert")
         ```
         """
-        q = select(model)
         filters = kwargs
+        by_pk = False
         if find_by:
             filters = {k: v for k, v in kwargs.items() if k in find_by}
         else:
             pks = list(map(lambda x: x.name, model.__mapper__.primary_key))
             if all(k in kwargs for k in pks):
                 filters = {k: v for k, v in kwargs.items() if k in pks}
+                by_pk = True
 
-        q = q.filter_by(**filters)
-
-        ret = self.exec(q).one_or_none()
+        if by_pk:
+            # served from the identity map when already loaded, no round trip
+            ret = self.get(model, filters)
+            if ret is not None and ret in self.deleted:
+                # get doesn't autoflush: flush the pending delete as a query would
+                self.flush()
+                ret = None
+        else:
+            q = select(model).filter_by(**filters)
+            ret = self.exec(q).one_or_none()
         if not ret:
             ret = model(**kwargs)
             self.add(ret)
@@ -262,7 +290,10 @@ class Session(SqlAlchemySession):
     def upsert(self, model: Type[Base], find_by=None, flush=True, **kwargs):
         """Update or create a model
 
-        it will update the model if it already exists before returning it
+        it will update the model if it already exists before returning it,
+        on sqlite and postgresql it runs as a single INSERT ... ON CONFLICT DO UPDATE
+        when the lookup fields are covered by a unique key, the kwargs provide every
+        required column and flush is True
 
         params:
         - find_by: a list of fields to find the model by, if not provided,
@@ -281,6 +312,17 @@ class Session(SqlAlchemySession):
             pks = list(map(lambda x: x.name, model.__mapper__.primary_key))
             if not all(k in kwargs for k in pks):
                 raise DbException("find_by or primary key must be provided")
+        if flush:
+            try:
+                dialect = self.get_bind(model).dialect
+            except UnboundExecutionError:
+                dialect = None
+            stmt = native_upsert(model, dialect, find_by, kwargs)
+            if stmt is not None:
+                self.flush()
+                return self.scalars(
+                    stmt, execution_options={"populate_existing": True}
+                ).one()
         e = self.find_or_create(model, find_by=find_by, flush=False, **kwargs)
         for k, v in kwargs.items():
             setattr(e, k, v)
@@ -394,7 +436,20 @@ class SelectModel(Select[T], Queryable):
         super().__init__(*entities, **kwargs)
 
     def count(self) -> "SelectModel[Any]":
-        return select(func.count()).select_from(self.subquery())
+        if (
+            self._group_by_clauses
+            or self._having_criteria
+            or self._distinct
+            or self._limit_clause is not None
+            or self._offset_clause is not None
+            or self._fetch_clause is not None
+            or not all(d["expr"] is d["entity"] for d in self.column_descriptions)
+        ):
+            return select(func.count()).select_from(self.subquery())
+        # a plain filtered select of mapped entities can be counted in place
+        return self.with_only_columns(
+            func.count(), maintain_column_froms=True
+        ).order_by(None)
 
 
 def select(*entities: T | Any) -> SelectModel[T]:
@@ -7,21 +7,26 @@ from typing import (
     TYPE_CHECKING,
 )
 from typing_extensions import Self
+from functools import lru_cache
 from sqlalchemy import desc, func
 from sqlalchemy.orm import (
     joinedload,
+    raiseload,
     selectinload,
 )
 from sqlalchemy.orm.relationships import RelationshipProperty
 from sqlalchemy.orm.properties import ColumnProperty
 from fastapi import HTTPException
 from datetime import datetime, date
-from inflection import underscore
+from inflection import underscore as _underscore
 
 from ..utils.misc import parse_bool, log
 from ..utils.config import FastapiSoloConfig
 from ..utils.db import get_single_pk
 
+# filter and sort keys repeat across requests, skip the regex pass for known ones
+underscore = lru_cache(maxsize=1024)(_underscore)
+
 
 class Queryable:
     """Mixin to make a model queryable"""
@@ -200,10 +205,11 @@ class Queryable:
         if "*" in include:
             return q.options(selectinload("*"))
         for rel in include:
-            rels = rel.split(".")
-            join = self._join(self.model, rels)
+            join = _include_option(type(self), self.model, rel)
             if join:
                 q = q.options(join)
+        if include and FastapiSoloConfig.includes_raiseload:
+            q = q.options(raiseload("*"))
         return q
 
     def paginate(self, page: Optional[int], size: int | str | None = None) -> Self:
@@ -226,18 +232,20 @@ class Queryable:
 
         return q.where(pk == id)
 
-    def _join(self, parent, rels, join=None, silent=False):
-        attr = self._get_model_attr(parent, rels[0])
+    @classmethod
+    def _join(cls, parent, rels, join=None, silent=False):
+        attr = cls._get_model_attr(parent, rels[0])
         attr_type = getattr(attr, "property", None)
         if attr and attr_type and isinstance(attr_type, RelationshipProperty):
-            join = self._apply_join(join, attr, attr_type)
+            join = cls._apply_join(join, attr, attr_type)
             if len(rels) > 1:
-                join = self._join(attr.mapper.class_, rels[1:], join)
+                join = cls._join(attr.mapper.class_, rels[1:], join)
         elif not silent:
             raise HTTPException(422, f"Invalid relationship {rels[0]}")
         return join
 
-    def _apply_join(self, join, attr, attr_type):
+    @staticmethod
+    def _apply_join(join, attr, attr_type):
         if attr_type.uselist:
             join_fn = join.selectinload if join else selectinload
         else:
@@ -269,7 +277,8 @@ class Queryable:
             log.warning(f"Invalid filter value {value} for {attr} - skipping filter")
         return q
 
-    def _get_model_attr_k(self, model, key: str):
+    @staticmethod
+    def _get_model_attr_k(model, key: str):
         attr = getattr(model, key, None)
         if not attr and model.__mapper__.polymorphic_map:
             for mapper in model.__mapper__.polymorphic_map.values():
@@ -278,13 +287,20 @@ class Queryable:
                     break
         return attr
 
-    def _get_model_attr(self, model, key: str):
-        attr = self._get_model_attr_k(model, key)
+    @classmethod
+    def _get_model_attr(cls, model, key: str):
+        attr = cls._get_model_attr_k(model, key)
         if not attr:
-            attr = self._get_model_attr_k(model, underscore(key))
+            attr = cls._get_model_attr_k(model, underscore(key))
         return attr
 
 
+@lru_cache(maxsize=1024)
+def _include_option(queryable_cls, model, rel: str):
+    # loader options are immutable, the one built for an include path can be reused
+    return queryable_cls._join(model, rel.split("."))
+
+
 def _set_queryables(cls, filter_by):
     if filter_by == "*":
         filter_by = list(map(lambda x: x.name, cls.__mapper__.c))
@@ -5,6 +5,8 @@ from typing import (
     Type,
     Union,
     Dict,
+    FrozenSet,
+    Mapping,
     Set,
     Tuple,
     Any,
@@ -19,10 +21,14 @@ from ..utils.db import get_single_pk
 
 from .schemas import BaseSchema, HasMany, HasOne, Lazy
 
-SymList = Dict[str, Any] | Set[str] | Tuple | List
+SymList = Mapping[str, Any] | Set[str] | FrozenSet[str] | Tuple | List
 
+_SYM_COLLECTIONS = (Mapping, set, frozenset, tuple, list)
 
-def _flatten_sym_list(sym_list: Set[str] | Tuple[str] | List[str]) -> Dict[str, Any]:
+
+def _flatten_sym_list(
+    sym_list: Set[str] | FrozenSet[str] | Tuple[str] | List[str],
+) -> Dict[str, Any]:
     base = {}
     for k in sym_list:
         if isinstance(k, str):
@@ -33,11 +39,13 @@ def _flatten_sym_list(sym_list: Set[str] | Tuple[str] | List[str]) -> Dict[str,
 
 
 def _normalize_sym_list(sym_list: SymList) -> Dict[str, Any]:
-    if isinstance(sym_list, dict):
-        for k, v in sym_list.items():
-            if isinstance(v, (set, tuple, list, dict)):
-                sym_list[k] = _normalize_sym_list(v)
-    elif isinstance(sym_list, (set, tuple, list)):
+    # always build a new dict, specs can be shared or read-only (frozenset, MappingProxyType)
+    if isinstance(sym_list, Mapping):
+        return {
+            k: _normalize_sym_list(v) if isinstance(v, _SYM_COLLECTIONS) else v
+            for k, v in sym_list.items()
+        }
+    elif isinstance(sym_list, (set, frozenset, tuple, list)):
         return _flatten_sym_list(sym_list)
     return sym_list
 
@@ -90,15 +98,15 @@ def _build_relationship(
     e = {}
     i = {}
     x = {}
-    if exclude and isinstance(exclude, dict):
+    if exclude and isinstance(exclude, Mapping):
         e = exclude.get(rel_key, {})
-    if include and isinstance(include, dict):
+    if include and isinstance(include, Mapping):
         i = include.get(rel_key, {})
-    if isinstance(relationships, dict) and isinstance(
-        relationships[rel_key], (dict, set, tuple, list)
+    if isinstance(relationships, Mapping) and isinstance(
+        relationships[rel_key], _SYM_COLLECTIONS
     ):
         r = relationships[rel_key]
-    if extras.get(rel_key) and isinstance(extras[rel_key], dict):
+    if extras.get(rel_key) and isinstance(extras[rel_key], Mapping):
         x = extras[rel_key]
     schema_rel = _generate_schema(model_rel, e, i, r, x, all_optional, include_virtuals)
     if rel.uselist:
@@ -163,7 +171,7 @@ def _custom_schema(
     extras = {
         k: (v, None if all_optional or _is_optional(v) else ...)
         for k, v in extras.items()
-        if not isinstance(v, dict)
+        if not isinstance(v, Mapping)
     }
     return create_model(
         base_name or name, __base__=BaseSchema, **fields, **rel_fields, **extras
@@ -207,7 +215,7 @@ def _qs_dict(e: SymList):
     a = []
     keys = sorted(e)
     for k in keys:
-        if isinstance(e, dict) and isinstance(e[k], (dict, set, tuple, list)):
+        if isinstance(e, Mapping) and isinstance(e[k], _SYM_COLLECTIONS):
             a.append(f"{k}[{_qs_dict(e[k])}]")
         else:
             a.append(k)
@@ -322,7 +330,7 @@ def _generate_schema(
 ) -> Any:
     if include:
         relationships = {
-            k: v for k, v in include.items() if isinstance(v, (dict, set, tuple, list))
+            k: v for k, v in include.items() if isinstance(v, _SYM_COLLECTIONS)
         }
     if isinstance(model, str):
         model = Base.get_model(model)
@@ -370,7 +378,7 @@ def request_schema(
     if isinstance(model, str):
         model = Base.get_model(model)
     pk = get_single_pk(model).name
-    if not isinstance(exclude, dict):
+    if not isinstance(exclude, Mapping):
         exclude = {k: True for k in exclude}
     return _generic_schema(
         model,
@@ -409,11 +417,11 @@ class _MetaSchema(type):
                 if isinstance(model, str):
                     model = Base.get_model(model)
                 pk = get_single_pk(model).name
-                if not isinstance(attrs["__exclude__"], dict):
+                if not isinstance(attrs["__exclude__"], Mapping):
                     attrs["__exclude__"] = {k: True for k in attrs["__exclude__"]}
                 attrs["__exclude__"] = {pk: True, **attrs["__exclude__"]}
             if attrs["__exclude_timestamps__"]:
-                if not isinstance(attrs["__exclude__"], dict):
+                if not isinstance(attrs["__exclude__"], Mapping):
                     attrs["__exclude__"] = {k: True for k in attrs["__exclude__"]}
                 attrs["__exclude__"] = {
                     "created_at": True,
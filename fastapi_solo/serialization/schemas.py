@@ -10,6 +10,7 @@ from typing import (
     Dict,
     Literal,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -20,6 +21,7 @@ from sqlalchemy import inspect
 from sqlalchemy.ext.associationproxy import AssociationProxy
 from inflection import camelize
 from collections import namedtuple
+from functools import lru_cache
 from datetime import datetime
 
 from ..utils.misc import RuntimeType
@@ -226,8 +228,13 @@ class CommonQueryParams:
 # models relationships
 
 
+@lru_cache(maxsize=None)
+def _open_struct_class(fields: Tuple[str, ...]):
+    return namedtuple("OpenStruct", fields)
+
+
 def OpenStruct(**kwargs):
-    return namedtuple("OpenStruct", kwargs.keys())(**kwargs)
+    return _open_struct_class(tuple(kwargs))(**kwargs)
 
 
 def lazy_validator(value):
@@ -2,3 +2,5 @@ class FastapiSoloConfig:
     pagination_size = 20
     queryable_use_like = False
     delete_status_code = 204
+    # raise on access to relationships not listed in includes
+    includes_raiseload = False
@@ -1,6 +1,8 @@
 import datetime
+from functools import lru_cache
 from sys import version_info
-from sqlalchemy import DateTime, func
+from typing import Any, Dict, FrozenSet, List, Optional
+from sqlalchemy import DateTime, Dialect, PrimaryKeyConstraint, UniqueConstraint, func
 from sqlalchemy.orm import MappedColumn
 from ..exc import DbException
 
@@ -40,3 +42,90 @@ def get_single_pk(model):
     if len(pk) > 1:
         raise DbException("Composite primary key not supported")
     return pk[0]
+
+
+@lru_cache(maxsize=None)
+def get_unique_keys(model) -> List[FrozenSet]:
+    """Column sets of the primary key, unique constraints and unique indexes of a model"""
+    table = model.__table__
+    keys = [
+        frozenset(c.columns)
+        for c in table.constraints
+        if isinstance(c, (PrimaryKeyConstraint, UniqueConstraint))
+    ]
+    keys += [frozenset(i.columns) for i in table.indexes if i.unique]
+    return keys
+
+
+def native_upsert(
+    model,
+    dialect: Optional[Dialect],
+    find_by: Optional[List[str]],
+    values: Dict[str, Any],
+):
+    """Build an `INSERT ... ON CONFLICT DO UPDATE ... RETURNING` statement
+
+    returns None when it can't be used: the dialect has no native upsert or no
+    RETURNING, a value is not a plain column, the find_by columns don't match a
+    unique key, the values don't cover every required column (the database checks
+    NOT NULL on the inserted row before resolving the conflict), an `onupdate`
+    column is not among the values (ON CONFLICT DO UPDATE would always write it,
+    the ORM emits no UPDATE for unchanged rows) or the model has validators or
+    insert/update events the ORM path would run
+    """
+    if dialect is None or not dialect.insert_returning:
+        return None
+    if dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+
+    mapper = model.__mapper__
+    if (
+        mapper.validators
+        or mapper.dispatch.before_insert
+        or mapper.dispatch.after_insert
+        or mapper.dispatch.before_update
+        or mapper.dispatch.after_update
+    ):
+        return None
+    attrs = mapper.column_attrs
+    if not all(k in attrs for k in values):
+        return None
+    if find_by:
+        if not all(k in values for k in find_by):
+            return None
+        conflict = [attrs[k].columns[0] for k in find_by]
+    else:
+        conflict = list(mapper.primary_key)
+    if frozenset(conflict) not in get_unique_keys(model):
+        return None
+
+    table = model.__table__
+    given = {attrs[k].columns[0] for k in values}
+    for c in table.columns:
+        if c in given:
+            continue
+        if c.onupdate is not None:
+            return None
+        if (
+            not c.nullable
+            and c.default is None
+            and c.server_default is None
+            and c is not table.autoincrement_column
+        ):
+            return None
+
+    stmt = insert(model).values(**values)
+    update = {
+        c.name: stmt.excluded[c.name]
+        for c in table.columns
+        if c not in conflict and c in given
+    }
+    if not update:
+        return None
+    return stmt.on_conflict_do_update(index_elements=conflict, set_=update).returning(
+        model
+    )
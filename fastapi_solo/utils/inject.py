@@ -1,10 +1,11 @@
 from typing import Annotated, Any, Optional, get_args, get_origin
 from types import GeneratorType
+from weakref import WeakKeyDictionary
 from inspect import signature
 from fastapi import Request, BackgroundTasks
 from fastapi.params import Depends
 from pydantic.fields import FieldInfo
-from .misc import InjectedBackgroundTasks
+from .misc import InjectedBackgroundTasks, VOID_CALLBACK
 
 
 def _close_yields(yields):
@@ -40,42 +41,73 @@ def _resolve_dep(dep, use_cache, cache, yields):
         return _init_dep(dep, cache, yields)
 
 
-def _resolve_dependencies(sign, kwargs, cache, yields):
-    for key, p in sign.parameters.items():
-        if key in kwargs:
-            continue
+def _dep_entry(key, dependency, use_cache):
+    if dependency is VOID_CALLBACK:
+        # nothing to call, it would always resolve to None
+        return ("default", key, None, None)
+    return ("dep", key, dependency, use_cache)
 
+
+def _build_plan(sign):
+    plan = []
+    for key, p in sign.parameters.items():
         if isinstance(p.default, Depends):
-            kwargs[key] = _resolve_dep(
-                p.default.dependency or p.annotation,
-                p.default.use_cache,
-                cache,
-                yields,
+            plan.append(
+                _dep_entry(
+                    key, p.default.dependency or p.annotation, p.default.use_cache
+                )
             )
         elif isinstance(p.default, FieldInfo):
-            kwargs[key] = p.default.default
+            plan.append(("default", key, p.default.default, None))
         elif p.annotation == Request:
-            kwargs[key] = cache.get(Request)
+            plan.append(("request", key, None, None))
         elif p.annotation == BackgroundTasks:
-            kwargs[key] = cache.get(BackgroundTasks) or InjectedBackgroundTasks()
+            plan.append(("background_tasks", key, None, None))
         elif get_origin(p.annotation) is Annotated:
             d_type, meta_deps = get_args(p.annotation)
             if isinstance(meta_deps, Depends):
-                kwargs[key] = _resolve_dep(
-                    meta_deps.dependency or d_type,
-                    meta_deps.use_cache,
-                    cache,
-                    yields,
+                plan.append(
+                    _dep_entry(key, meta_deps.dependency or d_type, meta_deps.use_cache)
                 )
+    return plan
+
+
+_plans: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_plan(fn):
+    # nested dependencies are re-wrapped on every resolution, inspect them once
+    try:
+        return _plans[fn]
+    except KeyError:
+        plan = _plans[fn] = _build_plan(signature(fn))
+        return plan
+    except TypeError:  # not weak-referenceable
+        return _build_plan(signature(fn))
+
+
+def _resolve_dependencies(plan, kwargs, cache, yields):
+    for kind, key, value, use_cache in plan:
+        if key in kwargs:
+            continue
+
+        if kind == "dep":
+            kwargs[key] = _resolve_dep(value, use_cache, cache, yields)
+        elif kind == "default":
+            kwargs[key] = value
+        elif kind == "request":
+            kwargs[key] = cache.get(Request)
+        else:
+            kwargs[key] = cache.get(BackgroundTasks) or InjectedBackgroundTasks()
 
 
 def _injector_fn(fn, _cache, _yields):
-    sign = signature(fn)
+    plan = _get_plan(fn)
 
     def wrapper(*args, **kwargs):
         cache = _cache if _cache is not None else {}
         yields = _yields if _yields is not None else []
-        _resolve_dependencies(sign, kwargs, cache, yields)
+        _resolve_dependencies(plan, kwargs, cache, yields)
         try:
             res = fn(*args, **kwargs)
         except Exception as e:
@@ -37,6 +37,7 @@ def parse_bool(string: str | bool):
 
 def _void_callback() -> Any:
     # This is a void callback, it does nothing
+    # callers can compare against VOID_CALLBACK by identity to skip calling it
     pass
 
 
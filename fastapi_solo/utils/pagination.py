@@ -31,16 +31,30 @@ def paginate_query(
         if before_render:
             data = before_render(data)
         return {"data": data}
+    data = db.exec(query.paginate(page=page, size=size)).all()  # type: ignore
     if isinstance(query, Query):
+        # Query.all() deduplicates entities, a short page doesn't mean the last one
         count = query.count()  # type: ignore
     else:
-        count: int = db.execute(query.count()).unique().scalar()  # type: ignore
-    data = db.exec(query.paginate(page=page, size=size)).all()  # type: ignore
+        count = count_from_page(data, page, size)  # type: ignore
+        if count is None:
+            count = db.execute(query.count()).unique().scalar()  # type: ignore
     if before_render:
         data = before_render(data)
     return paginate_result(data, count, page, size)
 
 
+def count_from_page(data: Sequence, page: int, size: int) -> Optional[int]:
+    """Total count of a paginated query when it can be told from a short page, None otherwise
+
+    a page with less than size elements is the last one, so no COUNT query is needed;
+    only valid when every fetched row is an element, as for Select statements
+    """
+    if page >= 1 and len(data) < size and (data or page == 1):
+        return (page - 1) * size + len(data)
+    return None
+
+
 def paginate_result(
     result: Sequence, count: int, page: int, size: int | str | None = None
 ):
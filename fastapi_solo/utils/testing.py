@@ -8,6 +8,10 @@ from ..utils.misc import log
 from ..utils.config import FastapiSoloConfig
 
 
+def _page_params(number: int, size: int):
+    return {"page[number]": number, "page[size]": size}
+
+
 def check_filters(
     client, path: str, filters: dict, expected_result=None, result_count: int = 1
 ):
@@ -27,8 +31,8 @@ def check_filters(
     Example:
     - check_filters(client, "/posts", {"title": "Hello, world!"}, {"title": "Hello, world!"})
     """
-    query = "&".join([f"filter[{field}]={value}" for field, value in filters.items()])
-    response = client.get(f"{path}?{query}")
+    params = {f"filter[{field}]": value for field, value in filters.items()}
+    response = client.get(path, params=params)
     assert response.status_code == 200
     data = response.json().get("data")
     assert len(data) == result_count
@@ -53,13 +57,13 @@ def check_sort(client, path: str, field: str = "id"):
     Example:
     - check_sort(client, "/posts", "title")
     """
-    response = client.get(f"{path}?sort={field}")
+    response = client.get(path, params={"sort": field})
     data = response.json().get("data")
     assert response.status_code == 200
     ids = [obj[camelize(field, False)] for obj in data]
     assert ids == sorted(ids)
 
-    response = client.get(f"{path}?sort=-{field}")
+    response = client.get(path, params={"sort": f"-{field}"})
     data = response.json().get("data")
     assert response.status_code == 200
     ids = [obj[camelize(field, False)] for obj in data]
@@ -86,7 +90,7 @@ def check_pagination(client, path: str, total: int, page_size: int = 2):
     """
     assert total >= page_size * 2
 
-    response = client.get(f"{path}?page[number]=1&page[size]={page_size}")
+    response = client.get(path, params=_page_params(1, page_size))
     body = response.json()
     data = body.get("data")
     meta = body.get("meta")
@@ -101,7 +105,7 @@ def check_pagination(client, path: str, total: int, page_size: int = 2):
     assert meta["nextPage"] == 2
     assert meta["previousPage"] is None
 
-    response = client.get(f"{path}?page[number]={total_pages}&page[size]={page_size}")
+    response = client.get(path, params=_page_params(total_pages, page_size))
     body = response.json()
     data = body.get("data")
     meta = body.get("meta")
@@ -112,7 +116,7 @@ def check_pagination(client, path: str, total: int, page_size: int = 2):
     assert meta["nextPage"] is None
     assert meta["previousPage"] == total_pages - 1
 
-    response = client.get(f"{path}?page[number]={total_pages+1}&page[size]={page_size}")
+    response = client.get(path, params=_page_params(total_pages + 1, page_size))
     body = response.json()
     data = body.get("data")
     meta = body.get("meta")
@@ -1,3 +1,3 @@
 #!/usr/bin/env bash
 
-poetry run pytest --cov=fastapi_solo --cov-report=html:cover 
\ No newline at end of file
+poetry run pytest -n auto --cov=fastapi_solo --cov-report=html:cover 
\ No newline at end of file
@@ -1,10 +1,12 @@
+import os
 import pytest
 from typing import Any, AsyncGenerator, Generator
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import pytest_asyncio
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy import create_engine, event, Engine, Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
 from fastapi_solo import Base, Session, SessionFactory, Transaction
 from fastapi_solo.aio import (
     AsyncSessionFactory,
@@ -13,30 +15,82 @@ from fastapi_solo.aio import (
     get_async_db,
 )
 from fastapi_solo.db.database import get_db
+from tests.mock.models import Post, Tag, Message
 from tests.mock.router import api_router
 from tests.mock.async_router import async_api_router
 from httpx import ASGITransport, AsyncClient
 
+# set SQL_ECHO=1 to log every statement while debugging a test
+SQL_ECHO = os.getenv("SQL_ECHO", "").lower() not in ("", "0", "false")
 
-@pytest.fixture(autouse=True, scope="session")
-def create_db() -> Generator[Any, Any, None]:
+
+def _enable_sqlite_savepoints(engine):
+    # pysqlite emits BEGIN lazily, which breaks SAVEPOINT handling
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def pytest_collection_modifyitems(items):
+    # run every async test on the one session loop the async fixtures live in
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def engine() -> Engine:
+    # in-memory and process-local, so every xdist worker gets its own database
     engine = create_engine(
-        "sqlite:///test.db", connect_args={"check_same_thread": False}, echo=True
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=SQL_ECHO,
     )
+    _enable_sqlite_savepoints(engine)
+    return engine
+
+
+@pytest.fixture(scope="session")
+def async_engine() -> AsyncEngine:
     async_engine = create_async_engine(
-        "sqlite+aiosqlite:///test.db",
+        "sqlite+aiosqlite://",
         connect_args={"check_same_thread": False},
-        echo=True,
+        poolclass=StaticPool,
+        echo=SQL_ECHO,
     )
+    _enable_sqlite_savepoints(async_engine.sync_engine)
+    return async_engine
 
+
+@pytest.fixture(autouse=True, scope="session")
+def create_db(engine: Engine, async_engine: AsyncEngine) -> Generator[Any, Any, None]:
     SessionFactory.init(engine)
     AsyncSessionFactory.init(async_engine)
     Transaction._allow_nesting_root_router_transaction = True
     AsyncTransaction._allow_nesting_root_router_transaction = True
-    Base.metadata.drop_all(engine)
-    Base.metadata.create_all(engine)  # Create the tables.
+    # a fresh in-memory database: no drop, no per-table existence check
+    Base.metadata.create_all(engine, checkfirst=False)
     yield
-    Base.metadata.drop_all(engine)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def create_async_db(async_engine: AsyncEngine) -> None:
+    # same fresh in-memory setup, created on the session loop so the single
+    # StaticPool connection is opened by the loop every async test runs on
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+
+
+@pytest.fixture(scope="session")
+def connection(engine: Engine) -> Generator[Connection, Any, None]:
+    with engine.connect() as conn:
+        yield conn
 
 
 @pytest.fixture(scope="session")
@@ -48,35 +102,132 @@ def app() -> FastAPI:
 
 
 @pytest.fixture()
-def db() -> Generator[Session, Any, None]:
-    session = SessionFactory.new()
+def db(connection: Connection) -> Generator[Session, Any, None]:
+    # every test runs in an outer transaction that is always rolled back,
+    # commits inside the test only release a SAVEPOINT
+    trans = connection.begin()
+    session = SessionFactory.new(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+        trans.rollback()
+
+
+@pytest.fixture()
+def fresh_session(db: Session) -> Generator[Session, Any, None]:
+    # a second session on the test connection: it sees the rows flushed by
+    # `db` but starts with an empty identity map, no expire_all needed
+    db.flush()
+    session = SessionFactory.new(bind=db.connection())
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
 
 
 @pytest_asyncio.fixture()
-async def async_db() -> AsyncGenerator[AsyncSession, Any]:
-    async with AsyncSessionFactory.open() as session:
+async def async_db(
+    async_engine: AsyncEngine, create_async_db
+) -> AsyncGenerator[AsyncSession, Any]:
+    # same outer transaction + SAVEPOINT scheme as the sync db fixture
+    async with async_engine.connect() as connection:
+        trans = await connection.begin()
+        session = AsyncSessionFactory.new(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
         try:
             yield session
         finally:
-            await session.rollback()
+            await session.close()
+            await trans.rollback()
 
 
 @pytest.fixture()
-def client(app: FastAPI, db) -> Generator[TestClient, Any, None]:
-    app.dependency_overrides[get_db] = lambda: db
+def count_queries() -> Generator[list, Any, None]:
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def mock_data(db: Session):
+    """Two posts with three tagged messages, returns (p1, p2, t1, t2, m1, m2, m3)"""
+    # one flush per dependency level, each batching the inserts of its tables
+    p1, p2 = Post(title="post"), Post(title="post2")
+    t1, t2 = Tag(name="tag"), Tag(name="tag2")
+    db.add_all([p1, p2, t1, t2])
+    db.flush()
+
+    m1 = Message(text="msg1", post_id=p1.id, tags=[t1, t2])
+    m2 = Message(text="msg2", post_id=p2.id, tags=[t1])
+    m3 = Message(text="msg3", post_id=p2.id, tags=[t2])
+    db.add_all([m1, m2, m3])
+    db.flush()
+    return (p1, p2, t1, t2, m1, m2, m3)
+
+
+@pytest.fixture()
+def two_posts(db: Session):
+    """Posts "post" and "post2" inserted in one statement, returns (p1, p2)"""
+    return tuple(Post.bulk_create(db, [{"title": "post"}, {"title": "post2"}]))
+
+
+@pytest_asyncio.fixture()
+async def amock_data(async_db: AsyncSession):
+    """Two posts with three tagged messages, returns (p1, p2, t1, t2, m1, m2, m3)"""
+    p1, p2 = Post(title="post"), Post(title="post2")
+    t1, t2 = Tag(name="tag"), Tag(name="tag2")
+    async_db.add_all([p1, p2, t1, t2])
+    await async_db.flush()
+
+    m1 = Message(text="msg1", post_id=p1.id, tags=[t1, t2])
+    m2 = Message(text="msg2", post_id=p2.id, tags=[t1])
+    m3 = Message(text="msg3", post_id=p2.id, tags=[t2])
+    async_db.add_all([m1, m2, m3])
+    await async_db.flush()
+    return (p1, p2, t1, t2, m1, m2, m3)
+
+
+@pytest.fixture(scope="session")
+def session_client(app: FastAPI) -> Generator[TestClient, Any, None]:
     with TestClient(app) as client:
         yield client
 
 
+@pytest.fixture()
+def client(
+    app: FastAPI, db, session_client: TestClient
+) -> Generator[TestClient, Any, None]:
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield session_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="session")
+def async_session_client(app: FastAPI) -> AsyncClient:
+    # ASGITransport holds no connections: nothing to close, and one client
+    # can serve every test's event loop
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
 @pytest_asyncio.fixture()
-async def async_client(app: FastAPI, async_db) -> AsyncGenerator[AsyncClient, Any]:
+async def async_client(
+    app: FastAPI, async_db, async_session_client: AsyncClient
+) -> AsyncGenerator[AsyncClient, Any]:
     app.dependency_overrides[get_async_db] = lambda: async_db
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        yield client
+    try:
+        yield async_session_client
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
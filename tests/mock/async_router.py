@@ -1,4 +1,5 @@
 from typing import Annotated
+from sqlalchemy.orm import selectinload, raiseload
 from fastapi_solo import (
     Router,
     PaginatedResponse,
@@ -27,8 +28,18 @@ async def async_get_all_posts(index: AsyncIndexDep[Post]):
     return await index.execute()
 
 
+_SCOPED_POSTS = (
+    select(Post)
+    .filter(Post.title.contains("test"))
+    .options(
+        selectinload(Post.messages).selectinload(Message.tags),
+        raiseload("*"),
+    )
+)
+
+
 def scope():
-    return select(Post).filter(Post.title.contains("test"))
+    return _SCOPED_POSTS
 
 
 @post_router.get("/scoped", response_model=PaginatedResponse[PostResponse])
@@ -68,7 +79,7 @@ async def update_post_scoped(
     return await update.execute(id, post)
 
 
-@post_router.put("/{id}/scopedput", response_model=PostResponse)
+@post_router.put("/{id}/scopedput2", response_model=PostResponse)
 async def update_post_scoped2(id: int, post: PostUpdate, update: AsyncUpdateDep[Post, scope]):  # type: ignore
     return await update.execute(id, post)
 
@@ -83,7 +94,7 @@ async def delete_post_scoped(id: int, delete: AsyncDeleteDep[Annotated[Post, sco
     return await delete.execute(id)
 
 
-@post_router.delete("/{id}/scopeddelete")
+@post_router.delete("/{id}/scopeddelete2")
 async def delete_post_scoped2(id: int, delete: AsyncDeleteDep[Post, scope]):  # type: ignore
     return await delete.execute(id)
 
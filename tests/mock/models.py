@@ -1,4 +1,5 @@
 from fastapi_solo import Base, SelectModel, queryable
+from fastapi_solo.utils.db import utcnow
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 
@@ -14,7 +15,7 @@ class Post(Base):
 
     @staticmethod
     def of_ids(q: SelectModel, term: str):
-        ids = [int(i) for i in term.split(",")]
+        ids = list(map(int, term.split(",")))
         return q.filter(Post.id.in_(ids))
 
     @staticmethod
@@ -49,3 +50,10 @@ class Message(Base):
     tags: Mapped[list["Tag"]] = relationship(
         secondary=message_tag, back_populates="messages"
     )
+
+
+class Touched(Base):
+    __tablename__ = "touched"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    touched = mapped_column(sa.DateTime, onupdate=utcnow)
@@ -1,4 +1,5 @@
 from typing import Annotated
+from sqlalchemy.orm import selectinload, raiseload
 from fastapi import Depends
 from fastapi_solo import (
     Router,
@@ -25,7 +26,15 @@ tag_router = Router(prefix="/tags")
 message_router = Router(prefix="/messages")
 post_router = Router(prefix="/posts")
 
-tag_router.generate_crud(Tag)
+
+_SCOPED_TAGS = select(Tag).options(raiseload("*"))
+
+
+def tag_scope():
+    return _SCOPED_TAGS
+
+
+tag_router.generate_crud(Tag, get_query=tag_scope)
 
 message_router.generate_crud(
     Message, response_schema=MessageResponse, update_schema=MessageUpdate
@@ -37,8 +46,18 @@ def get_all_posts(index: IndexDep[Post]):
     return index.execute()
 
 
+_SCOPED_POSTS = (
+    select(Post)
+    .filter(Post.title.contains("test"))
+    .options(
+        selectinload(Post.messages).selectinload(Message.tags),
+        raiseload("*"),
+    )
+)
+
+
 def scope():
-    return select(Post).filter(Post.title.contains("test"))
+    return _SCOPED_POSTS
 
 
 @post_router.get("/scoped", response_model=PaginatedResponse[PostResponse])
@@ -78,7 +97,7 @@ def update_post_scoped(
     return update.execute(id, post)
 
 
-@post_router.put("/{id}/scopedput", response_model=PostResponse)
+@post_router.put("/{id}/scopedput2", response_model=PostResponse)
 def update_post_scoped2(id: int, post: PostUpdate, update: UpdateDep[Post, scope]):  # type: ignore
     return update.execute(id, post)
 
@@ -93,7 +112,7 @@ def delete_post_scoped(id: int, delete: DeleteDep[Annotated[Post, scope]]):
     return delete.execute(id)
 
 
-@post_router.delete("/{id}/scopeddelete")
+@post_router.delete("/{id}/scopeddelete2")
 def delete_post_scoped2(id: int, delete: DeleteDep[Post, scope]):  # type: ignore
     return delete.execute(id)
 
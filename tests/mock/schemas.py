@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import List, Optional
 
 from fastapi_solo.serialization.schemas import all_optional
@@ -18,9 +19,7 @@ class MessageUpdate(RequestSchema):
 
 class PostResponse(ResponseSchema):
     __model__ = "Post"
-    __relationships__ = {
-        "messages": {"tags"},
-    }
+    __relationships__ = MappingProxyType({"messages": frozenset({"tags"})})
 
 
 class PostCreate(RequestSchema):
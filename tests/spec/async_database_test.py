@@ -80,8 +80,7 @@ async def test_find_or_create_by_not_full_match(async_db):
 
 @pytest.mark.asyncio
 async def test_find_or_create_by_not_unique(async_db):
-    await Post.acreate(async_db, title="post")
-    await Post.acreate(async_db, title="post")
+    await Post.abulk_create(async_db, [{"title": "post"}, {"title": "post"}])
     with pytest.raises(MultipleResultsFound):
         await async_db.find_or_create(Post, title="post")
 
@@ -99,6 +98,15 @@ async def test_find_or_create_by_find_by(async_db):
     assert p2.title == "post"
 
 
+@pytest.mark.asyncio
+async def test_find_or_create_by_pk_after_delete(async_db):
+    p1 = await Post.acreate(async_db, title="post")
+    await async_db.delete(p1)
+    p2 = await async_db.find_or_create(Post, id=p1.id, title="post2")
+    assert p2 is not p1
+    assert p2.id == p1.id and p2.title == "post2"
+
+
 @pytest.mark.asyncio
 async def test_find_or_create_by_find_by_not_match(async_db):
     p1 = await Post.acreate(async_db, title="post", rating=5)
@@ -128,6 +136,25 @@ async def test_upsert_with_update(async_db):
     assert p3.rating == 4
 
 
+@pytest.mark.asyncio
+async def test_upsert_by_pk_on_conflict(async_db):
+    p1 = await Post.acreate(async_db, title="post", rating=3)
+    p2 = await async_db.upsert(Post, id=p1.id, title="post2")
+    assert p2 is p1
+    assert p1.title == "post2" and p1.rating == 3
+
+
+@pytest.mark.asyncio
+async def test_upsert_partial_update_by_pk(async_db, amock_data):
+    p1, _, _, _, m1, _, _ = amock_data
+    p = await async_db.upsert(Post, id=p1.id, rating=5)
+    assert p is p1
+    assert p.title == "post" and p.rating == 5
+    m = await async_db.upsert(Message, id=m1.id, text="new")
+    assert m is m1
+    assert m.text == "new" and m.post_id == p1.id
+
+
 @pytest.mark.asyncio
 async def test_upsert_without_required_field(async_db):
     with pytest.raises(DbException):
@@ -136,12 +163,17 @@ async def test_upsert_without_required_field(async_db):
 
 @pytest.mark.asyncio
 async def test_upsert_not_unique(async_db):
-    await Post.acreate(async_db, title="post")
-    await Post.acreate(async_db, title="post")
+    await Post.abulk_create(async_db, [{"title": "post"}, {"title": "post"}])
     with pytest.raises(MultipleResultsFound):
         await async_db.upsert(Post, find_by=["title"], title="post", rating=4)
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_without_rows(async_db):
+    assert await Post.abulk_create(async_db, []) == []
+    assert (await async_db.exec(select(Post))).all() == []
+
+
 @pytest.mark.asyncio
 async def test_exec(async_db):
     r1 = await async_db.exec(insert(Post).values(title="post"))
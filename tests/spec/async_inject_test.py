@@ -2,6 +2,7 @@ import pytest
 from typing import Annotated
 from fastapi_solo import PaginationParams
 from fastapi_solo.aio import async_injector
+from fastapi_solo.utils import inject
 from fastapi_solo.utils.inject import InjectedBackgroundTasks
 from fastapi import BackgroundTasks, Depends
 from pydantic import Field
@@ -87,6 +88,25 @@ async def test_no_cache():
     await fn(6)
 
 
+@pytest.mark.asyncio
+async def test_nested_dependency_signature_is_inspected_once(mocker):
+    def dep1():
+        return 1
+
+    async def dep2(one=Depends(dep1)):
+        return one + 1
+
+    @async_injector
+    async def fn(x=Depends(dep2)):
+        return x
+
+    # the plans are built and cached by the sync injector module
+    spy = mocker.spy(inject, "signature")
+    assert await fn() == 2
+    assert await fn() == 2
+    assert spy.call_count == 2  # dep2 and dep1, only on the first call
+
+
 @pytest.mark.asyncio
 async def test_generators_cleanup():
     a = 0
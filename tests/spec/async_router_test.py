@@ -1,24 +1,11 @@
 import pytest
-from tests.mock.models import Post, Tag, Message
+from tests.mock.models import Post
 import fastapi_solo.aio.testing as r
 from fastapi_solo.utils.testing import a_list_of
 
 
-async def mock_data(db):
-    p1 = await Post(title="post").asave(db)
-    t1 = await Tag(name="tag").asave(db)
-    t2 = await Tag(name="tag2").asave(db)
-    m1 = await Message(text="msg1", post_id=p1.id, tags=[t1, t2]).asave(db)
-
-    p2 = await Post(title="post2").asave(db)
-    m2 = await Message(text="msg2", post_id=p2.id, tags=[t1]).asave(db)
-    m3 = await Message(text="msg3", post_id=p2.id, tags=[t2]).asave(db)
-    return (p1, p2, t1, t2, m1, m2, m3)
-
-
 @pytest.mark.asyncio
-async def test_get_all(async_db, async_client):
-    await mock_data(async_db)
+async def test_get_all(async_db, async_client, amock_data):
     response = await async_client.get("/async/posts?include=messages")
     assert response.status_code == 200
     assert r.match(
@@ -89,8 +76,7 @@ async def test_get_all(async_db, async_client):
 
 
 @pytest.mark.asyncio
-async def test_get_all_scoped(async_db, async_client):
-    await mock_data(async_db)
+async def test_get_all_scoped(async_db, async_client, amock_data):
     response = await async_client.get("/async/posts/scoped")
     assert response.status_code == 200
     assert r.match(
@@ -112,16 +98,16 @@ async def test_get_all_scoped(async_db, async_client):
 
 
 @pytest.mark.asyncio
-async def test_get_one(async_db, async_client):
-    await mock_data(async_db)
+async def test_get_one(async_db, async_client, amock_data):
     response = await async_client.get("/async/posts/1")
     assert response.status_code == 200
+    json = response.json()
     assert r.match(
-        response.json(),
+        json,
         {"id": 1},
     )
     # test relationship after first level are not loaded
-    assert response.json().get("messages") is None
+    assert json.get("messages") is None
 
 
 @pytest.mark.asyncio
@@ -132,8 +118,7 @@ async def test_get_one_not_found(async_db, async_client):
 
 
 @pytest.mark.asyncio
-async def test_get_one_with_includes(async_db, async_client):
-    await mock_data(async_db)
+async def test_get_one_with_includes(async_db, async_client, amock_data):
     response = await async_client.get("/async/posts/1?include=messages.tags")
 
     assert response.status_code == 200
@@ -152,8 +137,7 @@ async def test_get_one_with_includes(async_db, async_client):
 
 
 @pytest.mark.asyncio
-async def test_get_one_without_includes(async_db, async_client):
-    await mock_data(async_db)
+async def test_get_one_without_includes(async_db, async_client, amock_data):
     response = await async_client.get("/async/posts/1")
 
     assert response.status_code == 200
@@ -163,7 +147,7 @@ async def test_get_one_without_includes(async_db, async_client):
         json,
         {"id": 1},
     )
-    assert not hasattr(json, "messages")
+    assert "messages" not in json
 
 
 @pytest.mark.asyncio
@@ -196,8 +180,8 @@ async def test_update_fail(async_client):
 
 
 @pytest.mark.asyncio
-async def test_update_add_relationship(async_db, async_client):
-    p, *_ = await mock_data(async_db)
+async def test_update_add_relationship(async_db, async_client, amock_data):
+    p, *_ = amock_data
     await r.acheck_update(
         async_client,
         f"/async/posts/{p.id}?include=messages",
@@ -207,8 +191,8 @@ async def test_update_add_relationship(async_db, async_client):
 
 
 @pytest.mark.asyncio
-async def test_update_scoped(async_db, async_client):
-    p, *_ = await mock_data(async_db)
+async def test_update_scoped(async_db, async_client, amock_data):
+    p, *_ = amock_data
     response = await async_client.put(
         f"/async/posts/{p.id}/scopedput", json={"title": "new title"}
     )
@@ -226,7 +210,9 @@ async def test_update_scoped(async_db, async_client):
 
 @pytest.mark.asyncio
 async def test_read_posts(async_client, async_db):
-    posts = [await Post(title=f"test_{i}").asave(async_db) for i in range(10)]
+    posts = await Post.abulk_create(
+        async_db, [{"title": f"test_{i}"} for i in range(10)]
+    )
     await r.acheck_filters(
         async_client, "/async/posts", {"title_like": "_1"}, {"title": "test_1"}
     )
@@ -7,8 +7,7 @@ from tests.mock.models import Post
 
 @pytest.mark.asyncio
 async def test_paginate_query(async_db):
-    p1 = await Post.acreate(async_db, title="post")
-    await Post.acreate(async_db, title="post2")
+    p1, _ = await Post.abulk_create(async_db, [{"title": "post"}, {"title": "post2"}])
     q = select(Post)
     p = await apaginate_query(async_db, q, 1, 1)
     assert match(
@@ -29,8 +28,7 @@ async def test_paginate_query(async_db):
 
 @pytest.mark.asyncio
 async def test_paginate_query_all(async_db):
-    p1 = await Post.acreate(async_db, title="post")
-    p2 = await Post.acreate(async_db, title="post2")
+    p1, p2 = await Post.abulk_create(async_db, [{"title": "post"}, {"title": "post2"}])
     q = select(Post)
     p = await apaginate_query(async_db, q, 1, "all")
     assert match(
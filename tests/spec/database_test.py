@@ -1,10 +1,10 @@
 from fastapi import HTTPException
 import pytest
-from fastapi_solo import Base, BaseSchema, select, Transaction
+from fastapi_solo import Base, BaseSchema, Session, select, Transaction
 from fastapi_solo.exc import DbException
-from tests.mock.models import Post, Tag, Message
+from tests.mock.models import Post, Tag, Message, Touched
 from sqlalchemy.exc import MultipleResultsFound
-from sqlalchemy import insert
+from sqlalchemy import event, insert
 from sqlalchemy.orm.session import SessionTransaction
 
 
@@ -74,6 +74,22 @@ def test_find_or_create_by_pl(db):
     assert p2.title == "post"
 
 
+def test_find_or_create_by_pk_uses_identity_map(db, count_queries):
+    p1 = Post.create(db, title="post")
+    executed = len(count_queries)
+    p2 = db.find_or_create(Post, id=p1.id, title="post2")
+    assert p2 is p1
+    assert len(count_queries) == executed
+
+
+def test_find_or_create_by_pk_after_delete(db):
+    p1 = Post.create(db, title="post")
+    db.delete(p1)
+    p2 = db.find_or_create(Post, id=p1.id, title="post2")
+    assert p2 is not p1
+    assert p2.id == p1.id and p2.title == "post2"
+
+
 def test_find_or_create_by_not_full_match(db):
     p1 = Post.create(db, title="post", rating=5)
     p2 = db.find_or_create(Post, title="post", rating=4)
@@ -81,8 +97,7 @@ def test_find_or_create_by_not_full_match(db):
 
 
 def test_find_or_create_by_not_unique(db):
-    Post.create(db, title="post")
-    Post.create(db, title="post")
+    Post.bulk_create(db, [{"title": "post"}, {"title": "post"}])
     with pytest.raises(MultipleResultsFound):
         db.find_or_create(Post, title="post")
 
@@ -123,18 +138,89 @@ def test_upsert_with_update(db):
     assert p3.rating == 4
 
 
+def test_upsert_by_pk_on_conflict(db, count_queries):
+    p1 = Post.create(db, title="post", rating=3)
+    executed = len(count_queries)
+    p2 = db.upsert(Post, id=p1.id, title="post2")
+    assert p2 is p1
+    assert p1.title == "post2" and p1.rating == 3
+    assert len(count_queries) == executed + 1
+    assert "ON CONFLICT" in count_queries[-1]
+
+    p3 = db.upsert(Post, id=p1.id + 1, title="post3")
+    assert p3.id == p1.id + 1 and p3.rating == 0
+
+
+def test_upsert_partial_update_by_pk(db, mock_data):
+    p1, _, _, _, m1, _, _ = mock_data
+    p = db.upsert(Post, id=p1.id, rating=5)
+    assert p is p1
+    assert p.title == "post" and p.rating == 5
+    m = db.upsert(Message, id=m1.id, text="new")
+    assert m is m1
+    assert m.text == "new" and m.post_id == p1.id
+
+
+def test_upsert_with_onupdate_column_uses_orm(db, count_queries):
+    t = Touched.create(db, name="name")
+    t = db.upsert(Touched, id=t.id, name="name")
+    assert not any("ON CONFLICT" in q for q in count_queries)
+    # unchanged values emit no UPDATE, so onupdate is not applied
+    assert t.touched is None
+
+    t = db.upsert(Touched, id=t.id, name="name2")
+    assert t.name == "name2"
+    assert t.touched is not None
+
+
+def test_upsert_with_per_model_binds(db, count_queries):
+    p1 = Post.create(db, title="post", rating=3)
+    session = Session(binds={Post: db.connection()})
+    try:
+        p2 = session.upsert(Post, id=p1.id, title="post2")
+        assert "ON CONFLICT" in count_queries[-1]
+        assert p2.id == p1.id and p2.title == "post2" and p2.rating == 3
+    finally:
+        session.close()
+
+
+def test_upsert_runs_insert_events(db, count_queries):
+    def before_insert(mapper, connection, target):
+        target.rating = len(target.title)
+
+    event.listen(Post, "before_insert", before_insert)
+    try:
+        p = db.upsert(Post, id=99, title="post")
+    finally:
+        event.remove(Post, "before_insert", before_insert)
+    assert not any("ON CONFLICT" in q for q in count_queries)
+    assert p.rating == 4
+
+
+def test_upsert_without_insert_returning(db, count_queries, monkeypatch):
+    monkeypatch.setattr(db.get_bind(Post).dialect, "insert_returning", False)
+    p1 = Post.create(db, title="post")
+    p2 = db.upsert(Post, id=p1.id, title="post2")
+    assert not any("ON CONFLICT" in q for q in count_queries)
+    assert p2 is p1 and p1.title == "post2"
+
+
 def test_upsert_without_required_field(db):
     with pytest.raises(DbException):
         db.upsert(Post, rating=4)
 
 
 def test_upsert_not_unique(db):
-    Post.create(db, title="post")
-    Post.create(db, title="post")
+    Post.bulk_create(db, [{"title": "post"}, {"title": "post"}])
     with pytest.raises(MultipleResultsFound):
         db.upsert(Post, find_by=["title"], title="post", rating=4)
 
 
+def test_bulk_create_without_rows(db, count_queries):
+    assert Post.bulk_create(db, []) == []
+    assert not count_queries
+
+
 def test_exec(db):
     r1 = db.exec(insert(Post).values(title="post"))
     r2 = db.execute(insert(Post).values(title="post"))
@@ -1,6 +1,7 @@
 from typing import Annotated
 from fastapi_solo import injector, PaginationParams
 from fastapi_solo.utils.inject import InjectedBackgroundTasks
+from fastapi_solo.utils.misc import VOID_CALLBACK
 from fastapi import BackgroundTasks, Depends
 from pydantic import Field
 from tests.mock.router import get_all_posts
@@ -206,3 +207,11 @@ def test_inject_background_tasks():
         fn()
     except ValueError as e:
         assert str(e) == "test"
+
+
+def test_void_callback_injection():
+    @injector
+    def fn(a=Depends(VOID_CALLBACK)):
+        return a
+
+    assert fn() is None
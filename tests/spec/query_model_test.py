@@ -1,22 +1,12 @@
+import pytest
 from fastapi_solo import QueryModel, Session, select
+from fastapi_solo.utils.config import FastapiSoloConfig
 from tests.mock.models import Post, Tag, Message
-from sqlalchemy import desc
+from sqlalchemy import desc, func
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm.attributes import instance_state
 
 
-def mock_data(db):
-    p1 = Post(title="post").save(db)
-    t1 = Tag(name="tag").save(db)
-    t2 = Tag(name="tag2").save(db)
-    m1 = Message(text="msg1", post_id=p1.id, tags=[t1, t2]).save(db)
-
-    p2 = Post(title="post2").save(db)
-    m2 = Message(text="msg2", post_id=p2.id, tags=[t1]).save(db)
-    m3 = Message(text="msg3", post_id=p2.id, tags=[t2]).save(db)
-
-    return (p1, p2, t1, t2, m1, m2, m3)
-
-
 def test_query_class(db):
     assert isinstance(db, Session)
     q = db.query(Post)
@@ -24,13 +14,15 @@ def test_query_class(db):
     assert isinstance(q.where(Post.id == 1), QueryModel)
 
 
-def test_query_by(db):
-    p1, p2, *_ = mock_data(db)
+def test_query_by(db, mock_data):
+    p1, p2, *_ = mock_data
 
     pt = db.query(Post).query_by(title_like="2").all()
     assert len(pt) == 1
     pt = db.query(Post).query_by(title="post2").all()
     assert pt[0].id == p2.id
+    pt = db.query(Post).query_by(ids=f"{p1.id},{p2.id}").all()
+    assert {p.id for p in pt} == {p1.id, p2.id}
 
     Post.of_msg_txt = lambda q, txt: q.join(Post.messages).filter(Message.text == txt)
 
@@ -47,8 +39,8 @@ def test_query_by(db):
     assert len(pt) == 2
 
 
-def test_select_query_by(db):
-    p1, p2, *_ = mock_data(db)
+def test_select_query_by(db, mock_data):
+    p1, p2, *_ = mock_data
 
     q = select(Post).query_by(title_like="2")
     pt = db.exec(q).all()
@@ -77,8 +69,8 @@ def test_select_query_by(db):
     assert len(pt) == 2
 
 
-def test_only_decorated_query_by(db):
-    p1, p2, t1, t2, m1, m2, m3 = mock_data(db)
+def test_only_decorated_query_by(db, mock_data):
+    p1, p2, t1, t2, m1, m2, m3 = mock_data
 
     q = select(Message).query_by(text="msg1")
     m = db.exec(q).all()
@@ -87,8 +79,28 @@ def test_only_decorated_query_by(db):
     assert len(m) == count
 
 
-def test_sort_by(db):
-    p1, p2, *_ = mock_data(db)
+def test_select_count(db, mock_data):
+
+    q = select(Post).query_by(title_like="2").order_by(Post.id)
+    assert "FROM (" not in str(q.count())
+    assert db.exec(q.count()).one() == 1
+
+    q = select(Post.title).join(Post.messages).distinct()
+    assert "FROM (" in str(q.count())
+    assert db.exec(q.count()).one() == 2
+
+    # aggregates fold every row into one
+    q = select(func.max(Post.id))
+    assert "FROM (" in str(q.count())
+    assert db.exec(q.count()).one() == 1
+
+    # sqlite has no FETCH FIRST, check the count wraps it instead of running it
+    q = select(Post).fetch(1)
+    assert "FROM (" in str(q.count())
+
+
+def test_sort_by(db, mock_data):
+    p1, p2, *_ = mock_data
     pt = db.query(Post).sort("title").all()
     assert pt[0].id == p1.id
     assert pt[1].id == p2.id
@@ -108,8 +120,8 @@ def test_sort_by(db):
     assert pt[1].id == p1.id
 
 
-def test_select_sort_by(db):
-    p1, p2, *_ = mock_data(db)
+def test_select_sort_by(db, mock_data):
+    p1, p2, *_ = mock_data
     q = select(Post).sort("title")
     pt = db.exec(q).all()
     assert pt[0].id == p1.id
@@ -135,23 +147,36 @@ def test_select_sort_by(db):
     assert pt[1].id == p1.id
 
 
-def test_includes(db):
-    mock_data(db)
+def test_includes(db, mock_data):
     pt = db.query(Post).includes("messages.tags").first()
     assert "messages" not in instance_state(pt).unloaded
     assert "tags" not in instance_state(pt.messages[0]).unloaded
 
 
-def test_select_includes(db):
-    mock_data(db)
+def test_select_includes(db, mock_data):
     q = select(Post).includes("messages.tags")
     pt = db.exec(q).first()
     assert "messages" not in instance_state(pt).unloaded
     assert "tags" not in instance_state(pt.messages[0]).unloaded
 
 
-def test_select_includes_all(db):
-    mock_data(db)
+def test_select_includes_raiseload(db, monkeypatch, mock_data):
+    db.expunge_all()
+    monkeypatch.setattr(FastapiSoloConfig, "includes_raiseload", True)
+
+    m = db.exec(select(Message).includes("tags")).first()
+    assert len(m.tags) == 2
+    with pytest.raises(InvalidRequestError):
+        m.post
+
+
+def test_select_includes_reuses_options():
+    q1 = select(Post).includes("messages.tags")
+    q2 = select(Post).includes("messages.tags")
+    assert q1._with_options[0] is q2._with_options[0]
+
+
+def test_select_includes_all(db, mock_data):
     q = select(Post).includes("*")
     pt = db.exec(q).first()
     assert "messages" not in instance_state(pt).unloaded
@@ -1,30 +1,20 @@
+import pytest
 from fastapi_solo.utils.config import FastapiSoloConfig
 from tests.mock.models import Post, Tag, Message
 import fastapi_solo.utils.testing as r
+from fastapi_solo.utils.testing import a_list_of
 
 
-def mock_data(db):
-    p1 = Post(title="post").save(db)
-    t1 = Tag(name="tag").save(db)
-    t2 = Tag(name="tag2").save(db)
-    m1 = Message(text="msg1", post_id=p1.id, tags=[t1, t2]).save(db)
-
-    p2 = Post(title="post2").save(db)
-    m2 = Message(text="msg2", post_id=p2.id, tags=[t1]).save(db)
-    m3 = Message(text="msg3", post_id=p2.id, tags=[t2]).save(db)
-    return (p1, p2, t1, t2, m1, m2, m3)
-
-
-def test_get_one(db, client):
-    mock_data(db)
+def test_get_one(db, client, mock_data):
     response = client.get("/posts/1")
     assert response.status_code == 200
+    json = response.json()
     assert r.match(
-        response.json(),
+        json,
         {"id": 1},
     )
     # test relationship after first level are not loaded
-    assert response.json().get("messages") is None
+    assert json.get("messages") is None
 
 
 def test_get_one_not_found(db, client):
@@ -33,9 +23,17 @@ def test_get_one_not_found(db, client):
     assert r.match(response.json(), {"detail": "Post not found"})
 
 
-def test_get_one_with_includes(db, client):
-    mock_data(db)
+@pytest.fixture()
+def strict_includes(monkeypatch):
+    # relationships not listed in ?include= raise instead of lazy loading
+    monkeypatch.setattr(FastapiSoloConfig, "includes_raiseload", True)
+
+
+def test_get_one_with_includes(db, client, strict_includes, count_queries, mock_data):
+    count_queries.clear()
     response = client.get("/posts/1?include=messages.tags")
+    # post, messages and tags
+    assert len([q for q in count_queries if q.startswith("SELECT")]) == 3
 
     assert response.status_code == 200
     assert r.match(
@@ -52,8 +50,7 @@ def test_get_one_with_includes(db, client):
     )
 
 
-def test_get_one_without_includes(db, client):
-    mock_data(db)
+def test_get_one_without_includes(db, client, mock_data):
     response = client.get("/posts/1")
 
     assert response.status_code == 200
@@ -63,11 +60,10 @@ def test_get_one_without_includes(db, client):
         json,
         {"id": 1},
     )
-    assert not hasattr(json, "messages")
+    assert "messages" not in json
 
 
-def test_get_one_with_2includes(db, client):
-    mock_data(db)
+def test_get_one_with_2includes(db, client, strict_includes, mock_data):
     response = client.get("/messages/2?include=post.messages.tags")
 
     assert response.status_code == 200
@@ -92,73 +88,49 @@ def test_get_one_with_2includes(db, client):
     )
 
 
-def test_get_all(db, client):
-    mock_data(db)
-    response = client.get("/posts?include=messages")
-    assert response.status_code == 200
-    assert r.match(
-        response.json(),
-        {
-            "data": [
-                {
-                    "id": 1,
-                    "messages": [
-                        {
-                            "id": 1,
-                        },
-                    ],
-                },
-                {
-                    "id": 2,
-                    "messages": [
-                        {
-                            "id": 2,
-                        },
-                        {
-                            "id": 3,
-                        },
-                    ],
-                },
-            ],
-            "meta": {
-                "total": 2,
-                "currentPage": 1,
-                "totalPages": 1,
+@pytest.mark.parametrize(
+    "qs,expected",
+    [
+        (
+            "include=messages",
+            {
+                "data": [
+                    {"id": 1, "messages": [{"id": 1}]},
+                    {"id": 2, "messages": [{"id": 2}, {"id": 3}]},
+                ],
+                "meta": {"total": 2, "currentPage": 1, "totalPages": 1},
             },
-        },
-    )
-
-    # test pagination
-    response = client.get("/posts?page[size]=1")
-    assert response.status_code == 200
-    assert r.match(
-        response.json(),
-        {
-            "data": [{"id": 1}],
-            "meta": {
-                "total": 2,
-                "currentPage": 1,
-                "totalPages": 2,
-                "nextPage": 2,
+        ),
+        # pagination
+        (
+            "page[size]=1",
+            {
+                "data": [{"id": 1}],
+                "meta": {
+                    "total": 2,
+                    "currentPage": 1,
+                    "totalPages": 2,
+                    "nextPage": 2,
+                },
             },
-        },
-    )
-
-    # test filters
-    response = client.get("/posts?filter[title]=post2")
+        ),
+        # filters
+        ("filter[title]=post2", {"data": [{"id": 2}]}),
+        # sort
+        ("sort=-title", {"data": [{"id": 2}, {"id": 1}]}),
+    ],
+)
+def test_get_all(db, client, strict_includes, mock_data, qs, expected):
+    response = client.get(f"/posts?{qs}")
     assert response.status_code == 200
-    assert r.match(
-        response.json(),
-        {"data": [{"id": 2}]},
-    )
+    assert r.match(response.json(), expected)
 
-    # test sort
-    response = client.get("/posts?sort=-title")
-    assert response.status_code == 200
-    assert r.match(response.json(), {"data": [{"id": 2}, {"id": 1}]})
 
-    # test includes
+def test_get_all_with_includes(db, client, strict_includes, count_queries, mock_data):
+    count_queries.clear()
     response = client.get("/posts?include=messages.tags")
+    # posts, messages and tags, a single short page needs no count
+    assert len([q for q in count_queries if q.startswith("SELECT")]) == 3
     assert response.status_code == 200
     assert r.match(
         response.json(),
@@ -191,8 +163,7 @@ def test_get_all(db, client):
     )
 
 
-def test_get_all_scoped(db, client):
-    mock_data(db)
+def test_get_all_scoped(db, client, mock_data):
     response = client.get("/posts/scoped")
     assert response.status_code == 200
     assert r.match(
@@ -213,8 +184,30 @@ def test_get_all_scoped(db, client):
     )
 
 
-def test_get_all_scoped2(db, client):
-    mock_data(db)
+def test_get_all_scoped_eager_loads(db, client, count_queries):
+    for i in range(3):
+        p = Post.create(db, title=f"test{i}")
+        t = Tag.create(db, name=f"tag{i}")
+        Message.create(db, text=f"msg{i}", post_id=p.id, tags=[t.id])
+        Message.create(db, text=f"msg{i}b", post_id=p.id, tags=[t.id])
+    count_queries.clear()
+
+    response = client.get("/posts/scoped")
+    assert response.status_code == 200
+    assert r.match(
+        response.json(),
+        {
+            "data": a_list_of(
+                {"id": int, "messages": a_list_of({"id": int, "tags": [dict]})}
+            ),
+        },
+    )
+    # posts, messages and tags: no extra query per row
+    selects = [q for q in count_queries if q.startswith("SELECT")]
+    assert len(selects) == 3
+
+
+def test_get_all_scoped2(db, client, mock_data):
     response = client.get("/posts/scoped2")
     assert response.status_code == 200
     assert r.match(
@@ -225,6 +218,17 @@ def test_get_all_scoped2(db, client):
     )
 
 
+def test_get_tags_with_raiseload_scope(db, client, mock_data):
+    response = client.get("/tags")
+    assert response.status_code == 200
+    assert response.json()["data"][0].get("messages") is None
+
+    # explicit includes override the raiseload guard
+    response = client.get("/tags?include=messages")
+    assert response.status_code == 200
+    assert r.match(response.json(), {"data": [{"id": 1}, {"id": 2}]})
+
+
 def test_create_post(client, db):
     r.check_create(client, "/posts", {"title": "test_title"})
 
@@ -250,8 +254,8 @@ def test_update_fail(client):
     assert response.status_code == 404
 
 
-def test_update_remove_relationship(db, client):
-    p, p2, t1, t2, m, *_ = mock_data(db)
+def test_update_remove_relationship(db, client, mock_data):
+    p, p2, t1, t2, m, *_ = mock_data
     r.check_update(
         client,
         f"/messages/{m.id}",
@@ -260,8 +264,8 @@ def test_update_remove_relationship(db, client):
     )
 
 
-def test_update_add_relationship(db, client):
-    p, *_ = mock_data(db)
+def test_update_add_relationship(db, client, mock_data):
+    p, *_ = mock_data
     r.check_update(
         client,
         f"/posts/{p.id}",
@@ -270,8 +274,8 @@ def test_update_add_relationship(db, client):
     )
 
 
-def test_update_scoped(db, client):
-    p, *_ = mock_data(db)
+def test_update_scoped(db, client, mock_data):
+    p, *_ = mock_data
     response = client.put(f"/posts/{p.id}/scopedput", json={"title": "new title"})
     assert response.status_code == 404
     p = Post.create(db, title="test1")
@@ -283,14 +287,17 @@ def test_update_scoped(db, client):
     )
 
 
-def test_update_scoped2(db, client):
-    p, *_ = mock_data(db)
+def test_update_scoped2(db, client, mock_data):
+    p, *_ = mock_data
     response = client.put(f"/posts/{p.id}/scopedput2", json={"title": "new title"})
     assert response.status_code == 404
+    p = Post.create(db, title="test1")
+    response = client.put(f"/posts/{p.id}/scopedput2", json={"title": "new title"})
+    assert response.status_code == 200
 
 
 def test_read_posts(client, db):
-    posts = [Post(title=f"test_{i}").save(db) for i in range(10)]
+    posts = Post.bulk_create(db, [{"title": f"test_{i}"} for i in range(10)])
     r.check_filters(client, "/posts", {"title_like": "_1"}, {"title": "test_1"})
     r.check_filters(
         client, "/posts", {"ids": f"{posts[0].id},{posts[1].id}"}, result_count=2
@@ -304,8 +311,8 @@ def test_read_post(client, db):
     r.check_read(client, "/posts", post.id)
 
 
-def test_read_post_scoped(client, db):
-    p, *_ = mock_data(db)
+def test_read_post_scoped(client, db, mock_data):
+    p, *_ = mock_data
     response = client.get(f"/posts/{p.id}/scoped")
     assert response.status_code == 404
     p = Post.create(db, title="test1")
@@ -317,8 +324,8 @@ def test_read_post_scoped(client, db):
     )
 
 
-def test_read_post_scoped2(client, db):
-    p, *_ = mock_data(db)
+def test_read_post_scoped2(client, db, mock_data):
+    p, *_ = mock_data
     response = client.get(f"/posts/{p.id}/scoped2")
     assert response.status_code == 404
 
@@ -329,8 +336,8 @@ def test_remove_post(client, db):
     assert not db.get(Post, post.id)
 
 
-def test_remove_post_scoped(client, db):
-    p, *_ = mock_data(db)
+def test_remove_post_scoped(client, db, mock_data):
+    p, *_ = mock_data
     response = client.delete(f"/posts/{p.id}/scopeddelete")
     assert response.status_code == 404
     p = Post.create(db, title="test1")
@@ -338,7 +345,10 @@ def test_remove_post_scoped(client, db):
     assert response.status_code == FastapiSoloConfig.delete_status_code
 
 
-def test_remove_post_scoped2(client, db):
-    p, *_ = mock_data(db)
+def test_remove_post_scoped2(client, db, mock_data):
+    p, *_ = mock_data
     response = client.delete(f"/posts/{p.id}/scopeddelete2")
     assert response.status_code == 404
+    p = Post.create(db, title="test1")
+    response = client.delete(f"/posts/{p.id}/scopeddelete2")
+    assert response.status_code == FastapiSoloConfig.delete_status_code
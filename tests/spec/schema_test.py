@@ -1,22 +1,10 @@
 from fastapi_solo import response_schema, request_schema, select
-from tests.mock.models import Post, Tag, Message
+from tests.mock.models import Post, Message
 from typing import Optional
 
 
-def mock_data(db):
-    p1 = Post(title="post").save(db)
-    t1 = Tag(name="tag").save(db)
-    t2 = Tag(name="tag2").save(db)
-    m1 = Message(text="msg1", post_id=p1.id, tags=[t1, t2]).save(db)
-
-    p2 = Post(title="post2").save(db)
-    m2 = Message(text="msg2", post_id=p2.id, tags=[t1]).save(db)
-    m3 = Message(text="msg3", post_id=p2.id, tags=[t2]).save(db)
-    return (p1, p2, t1, t2, m1, m2, m3)
-
-
-def test_render_schema_base(db):
-    p1, *_ = mock_data(db)
+def test_render_schema_base(db, mock_data):
+    p1, *_ = mock_data
     schema = response_schema(Post)
     json = schema.render_json(p1)
     assert json["id"] == p1.id
@@ -24,8 +12,8 @@ def test_render_schema_base(db):
     assert json.get("messages") == None
 
 
-def test_render_schema_with_relationships(db):
-    p1, *_ = mock_data(db)
+def test_render_schema_with_relationships(db, mock_data):
+    p1, *_ = mock_data
     schema = response_schema(Post, relationships={"messages": {"tags"}})
     json = schema.render_json(p1)
     assert json["id"] == p1.id
@@ -34,21 +22,23 @@ def test_render_schema_with_relationships(db):
     assert len(json["messages"][0]["tags"]) == len(p1.messages[0].tags)
 
 
-def test_render_schema_with_relationships_dynamic_includes(db):
-    p1, *_ = mock_data(db)
+def test_render_schema_with_relationships_dynamic_includes(
+    db, fresh_session, mock_data
+):
+    p1, *_ = mock_data
     schema = response_schema(Post, relationships={"messages": {"tags"}})
     msg_len = len(p1.messages)
     tags_len = len(p1.messages[0].tags)
-    db.expire_all()
 
-    p = db.exec(select(Post).find_id(p1.id)).one()
+    p = fresh_session.get(Post, p1.id)
     json = schema.render_json(p)
     assert json["id"] == p.id
     assert json["title"] == p.title
     assert len(json["messages"]) == msg_len
     assert json["messages"][0].get("tags") == None
 
-    p = db.exec(select(Post).includes("messages.tags").find_id(p1.id)).one()
+    q = select(Post).includes("messages.tags").find_id(p1.id)
+    p = fresh_session.exec(q).one()
     json = schema.render_json(p)
     assert json["id"] == p.id
     assert json["title"] == p.title
@@ -56,8 +46,8 @@ def test_render_schema_with_relationships_dynamic_includes(db):
     assert len(json["messages"][0]["tags"]) == tags_len
 
 
-def test_render_schema_with_extra_fields(db):
-    p1, *_ = mock_data(db)
+def test_render_schema_with_extra_fields(db, mock_data):
+    p1, *_ = mock_data
     schema = response_schema(
         Post, relationships={"messages"}, extras={"messages": {"extra_field": str}}
     )
@@ -67,16 +57,16 @@ def test_render_schema_with_extra_fields(db):
     assert json["messages"][0]["extraField"] == "extra"
 
 
-def test_render_schema_with_all_lazy(db):
-    p1, *_ = mock_data(db)
+def test_render_schema_with_all_lazy(db, fresh_session, mock_data):
+    p1, *_ = mock_data
     schema = response_schema(Post, relationships={"messages"})
-    db.expire_all()
 
-    p = db.exec(select(Post).find_id(p1.id)).one()
+    p = fresh_session.get(Post, p1.id)
     json = schema.render_json(p, lazy_first_level=True)
     assert json.get("messages") == None
 
-    p = db.exec(select(Post).includes("messages").find_id(p1.id)).one()
+    q = select(Post).includes("messages").find_id(p1.id)
+    p = fresh_session.exec(q).one()
     json = schema.render_json(p, lazy_first_level=True)
     assert len(json["messages"]) == len(p.messages)
 
@@ -93,3 +83,12 @@ def test_put_schema():
     assert schema.__annotations__.get("id") == None
     assert schema.__annotations__["title"] == Optional[str]
     assert schema.model_fields["title"].default == None
+
+
+def test_schema_cache():
+    schema = response_schema(Message, relationships=("tags", {"post": {"messages"}}))
+    assert schema is response_schema(
+        Message, relationships=("tags", {"post": {"messages"}})
+    )
+    assert schema is not response_schema(Message, relationships=("tags",))
+    assert request_schema(Post, True) is request_schema(Post, True)
@@ -1,9 +1,10 @@
 import logging
+from functools import lru_cache
 from fastapi_solo import select
 from fastapi_solo.utils.misc import parse_bool
 from fastapi_solo.utils.pagination import paginate_query, paginate_list, paginate_result
 from fastapi_solo.utils.testing import match, validate_relationships
-from tests.mock.models import Post, Base
+from tests.mock.models import Message, Post, Base
 from sqlalchemy.orm import relationship
 import sqlalchemy as sa
 
@@ -16,9 +17,8 @@ def test_parse_bool():
     assert parse_bool(False) == False
 
 
-def test_paginate_query(db):
-    p1 = Post.create(db, title="post")
-    Post.create(db, title="post2")
+def test_paginate_query(db, two_posts):
+    p1, _ = two_posts
     q = select(Post)
     p = paginate_query(db, q, 1, 1)
     assert match(
@@ -37,9 +37,36 @@ def test_paginate_query(db):
     )
 
 
-def test_paginate_query_all(db):
-    p1 = Post.create(db, title="post")
-    p2 = Post.create(db, title="post2")
+def test_paginate_query_last_page_skips_count(db, count_queries):
+    Post.bulk_create(db, [{"title": f"post{i}"} for i in range(3)])
+    count_queries.clear()
+    p = paginate_query(db, select(Post), 2, 2)
+    assert match(p, {"meta": {"total": 3, "totalPages": 2, "nextPage": None}})
+    assert len(p["data"]) == 1
+    assert not any("count(" in q for q in count_queries)
+
+    p = paginate_query(db, select(Post), 3, 2)
+    assert match(p, {"data": [], "meta": {"total": 3, "totalPages": 2}})
+
+
+def test_paginate_legacy_query_short_page_counts(db, two_posts):
+    p1, p2 = two_posts
+    Message.bulk_create(
+        db,
+        [
+            {"text": "x", "post_id": p1.id},
+            {"text": "x", "post_id": p1.id},
+            {"text": "x", "post_id": p2.id},
+        ],
+    )
+    q = db.query(Post).join(Post.messages).filter(Message.text == "x")
+    p = paginate_query(db, q, 1, 2)
+    assert p["data"] == [p1]
+    assert match(p, {"meta": {"total": 3, "totalPages": 2, "nextPage": 2}})
+
+
+def test_paginate_query_all(db, two_posts):
+    p1, p2 = two_posts
     q = select(Post)
     p = paginate_query(db, q, 1, "all")
     assert match(
@@ -48,9 +75,8 @@ def test_paginate_query_all(db):
     )
 
 
-def test_paginate_list(db):
-    p1 = Post.create(db, title="post")
-    p2 = Post.create(db, title="post2")
+def test_paginate_list(db, two_posts):
+    p1, p2 = two_posts
     p = paginate_list([p1, p2], 1, 1)
     assert match(
         p,
@@ -68,9 +94,8 @@ def test_paginate_list(db):
     )
 
 
-def test_paginate_result(db):
-    p1 = Post.create(db, title="post")
-    Post.create(db, title="post2")
+def test_paginate_result(db, two_posts):
+    p1, _ = two_posts
     p = paginate_result([p1], 2, 1, 1)
     assert match(
         p,
@@ -94,17 +119,29 @@ def test_validate_relationships():
     assert validate_relationships("Tag")
 
 
-def test_validate_relationships_without_relationships():
+# declared lazily and once: mapping them at import time would register
+# the broken relationship for every other test module
+@lru_cache(maxsize=1)
+def _plain_class():
     class _Post2(Base):
         __tablename__ = "post2"
         id = sa.Column(sa.Integer, primary_key=True)
 
-    assert validate_relationships(_Post2)
+    return _Post2
 
 
-def test_validate_relationships_fail(caplog):
+@lru_cache(maxsize=1)
+def _broken_class():
     class _Post3(Post):
         wrong = relationship("Tag")
 
+    return _Post3
+
+
+def test_validate_relationships_without_relationships():
+    assert validate_relationships(_plain_class())
+
+
+def test_validate_relationships_fail(caplog):
     with caplog.at_level(logging.CRITICAL, logger="fastapi_solo"):
-        assert not validate_relationships(_Post3)
+        assert not validate_relationships(_broken_class())